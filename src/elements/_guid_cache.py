@@ -0,0 +1,45 @@
+import Rhino.Geometry as rg
+import rhinoscriptsyntax as rs
+from functools import lru_cache
+from typing import Optional
+
+
+# ---------------------------------------------------------------------
+# GUID-keyed coercion caches
+# ---------------------------------------------------------------------
+# Grasshopper re-executes components on every canvas tick, usually with
+# the same input GUIDs; each rs.coerce* call is a document-table
+# lookup. Caching by GUID makes unchanged inputs free. The caches are
+# flushed whenever the document changes.
+
+
+@lru_cache(maxsize=1024)
+def curve_by_guid(guid) -> Optional[rg.Curve]:
+    return rs.coercecurve(guid)
+
+
+@lru_cache(maxsize=1024)
+def point3d_by_guid(guid) -> Optional[rg.Point3d]:
+    geom = rs.coercegeometry(guid)
+    if isinstance(geom, rg.Point):
+        return geom.Location
+    if isinstance(geom, rg.Point3d):
+        return geom
+    return None
+
+
+def _clear(*_args):
+    curve_by_guid.cache_clear()
+    point3d_by_guid.cache_clear()
+
+
+try:
+    import Rhino
+
+    Rhino.RhinoDoc.AddRhinoObject += _clear
+    Rhino.RhinoDoc.ReplaceRhinoObject += _clear
+    Rhino.RhinoDoc.DeleteRhinoObject += _clear
+    Rhino.RhinoDoc.ModifyObjectAttributes += _clear
+except (ImportError, AttributeError):
+    # Outside a live Rhino session the caches simply never invalidate.
+    pass
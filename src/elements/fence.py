@@ -1,6 +1,10 @@
 import Rhino.Geometry as rg
 import rhinoscriptsyntax as rs
-from typing import List
+from typing import Dict, List, Tuple
+from System import Guid
+from System.Threading.Tasks import Parallel
+
+from ._guid_cache import curve_by_guid
 
 
 # ---------------------------------------------------------------------
@@ -9,27 +13,23 @@ from typing import List
 
 
 def _coerce_curve(curve) -> rg.Curve:
-    crv = rs.coercecurve(curve)
+    if isinstance(curve, Guid):
+        crv = curve_by_guid(curve)
+    else:
+        crv = rs.coercecurve(curve)
+
     if not crv:
         raise TypeError("guide must be a Curve")
     return crv
 
 
-def _frame_at(crv: rg.Curve, t: float) -> rg.Plane:
+def _frame_from(pt: rg.Point3d, x: rg.Vector3d) -> rg.Plane:
     """
-    Stable frame along curve:
+    Stable frame from a point and tangent:
     X = tangent
     Y = left
     Z = up
     """
-    ok, u = crv.NormalizedLengthParameter(t)
-    if not ok:
-        d = crv.Domain
-        u = d.T0 + (d.T1 - d.T0) * t
-
-    pt = crv.PointAt(u)
-
-    x = crv.TangentAt(u)
     if x.IsTiny():
         x = rg.Vector3d.XAxis
     x.Unitize()
@@ -43,6 +43,88 @@ def _frame_at(crv: rg.Curve, t: float) -> rg.Plane:
     return rg.Plane(pt, x, y)
 
 
+def _frame_at(crv: rg.Curve, t: float) -> rg.Plane:
+    """
+    Stable frame at a single normalized-length parameter.
+
+    Straight guides (the common BIM case) map t linearly onto the
+    domain, skipping the arc-length root-find entirely.
+    """
+    if crv.IsLinear(1e-6):
+        d = crv.Domain
+        u = d.T0 + (d.T1 - d.T0) * t
+        return _frame_from(crv.PointAt(u), crv.PointAtEnd - crv.PointAtStart)
+
+    ok, u = crv.NormalizedLengthParameter(t)
+    if not ok:
+        d = crv.Domain
+        u = d.T0 + (d.T1 - d.T0) * t
+
+    return _frame_from(crv.PointAt(u), crv.TangentAt(u))
+
+
+def _frames_along(
+    crv: rg.Curve,
+    count: int,
+    lateral_offset: rg.Vector3d,
+) -> List[rg.Plane]:
+    """
+    Evenly spaced frames along a curve, batch-evaluated.
+
+    A single DivideByCount pass replaces `count` individual
+    NormalizedLengthParameter root-finds; points and tangents are then
+    evaluated directly at the returned parameters.
+    """
+    us = crv.DivideByCount(count - 1, True)
+    if not us:
+        return []
+
+    frames: List[rg.Plane] = []
+    for u in us:
+        plane = _frame_from(crv.PointAt(u), crv.TangentAt(u))
+        plane.Origin += lateral_offset
+        frames.append(plane)
+
+    return frames
+
+
+# Frame lists keyed by (curve identity, post count, offset). Slider
+# tweaks to heights / rail counts re-invoke fence() with the same guide
+# object, and the frames depend only on this key — the cache makes
+# re-framing free across such calls. Each entry stores the coerced
+# curve next to its frames: the stored reference pins the id() against
+# reuse, and hits verify the entry still belongs to the same object
+# before serving it. The cache is flushed past a small bound.
+_frame_cache: Dict[Tuple[int, int, float], Tuple[rg.Curve, List[rg.Plane]]] = {}
+_FRAME_CACHE_MAX = 64
+
+
+def _rect_polyline_xy(
+    plane: rg.Plane,
+    depth: float,
+    width: float,
+) -> rg.PolylineCurve:
+    """
+    Centered rectangle in plane XY as a PolylineCurve.
+
+    A PolylineCurve profile extrudes on the lightweight polyline path;
+    Rectangle3d.ToNurbsCurve forces the heavier spline-extrude path and
+    stores knots/control points the profile does not need.
+    """
+    p0 = plane.PointAt(-depth * 0.5, -width * 0.5)
+    p1 = plane.PointAt(depth * 0.5, -width * 0.5)
+    p2 = plane.PointAt(depth * 0.5, width * 0.5)
+    p3 = plane.PointAt(-depth * 0.5, width * 0.5)
+
+    return rg.PolylineCurve([p0, p1, p2, p3, p0])
+
+
+# Master rectangle profiles at WorldXY, keyed by (depth, width).
+# Profile sizes are constant within a fence, so repeated calls reuse
+# one curve instead of churning Rectangle3d + NURBS conversions.
+_profile_cache: Dict[Tuple[float, float], rg.Curve] = {}
+
+
 def _rect_profile_xy(
     plane: rg.Plane,
     depth: float,
@@ -50,12 +132,19 @@ def _rect_profile_xy(
 ) -> rg.Curve:
     """
     Rectangle in plane XY (depth along X, width along Y), centered.
+
+    Returns a duplicate of a cached WorldXY master, moved into place.
     """
-    return rg.Rectangle3d(
-        plane,
-        rg.Interval(-depth * 0.5, depth * 0.5),
-        rg.Interval(-width * 0.5, width * 0.5),
-    ).ToNurbsCurve()
+    key = (float(depth), float(width))
+
+    master = _profile_cache.get(key)
+    if master is None:
+        master = _rect_polyline_xy(rg.Plane.WorldXY, depth, width)
+        _profile_cache[key] = master
+
+    profile = master.DuplicateCurve()
+    profile.Transform(rg.Transform.PlaneToPlane(rg.Plane.WorldXY, plane))
+    return profile
 
 
 def _post_brep_between_z(
@@ -100,7 +189,44 @@ def _rail_profile_YZ(
     p2 = o + y * (depth * 0.5) + z * (height * 0.5)
     p3 = o + y * (-depth * 0.5) + z * (height * 0.5)
 
-    return rg.Polyline([p0, p1, p2, p3, p0]).ToNurbsCurve()
+    return rg.PolylineCurve([p0, p1, p2, p3, p0])
+
+
+def _extrude_rail_segments(
+    pl: rg.Polyline,
+    depth: float,
+    height: float,
+) -> List[rg.Brep]:
+    """
+    Rail as one linear extrusion per polyline segment, joined and
+    capped. Avoids the full NURBS sweep machinery for straight guides.
+    """
+    slots: List[rg.Brep] = [None] * (pl.Count - 1)
+
+    for i in range(pl.Count - 1):
+        vec = pl[i + 1] - pl[i]
+        if vec.IsTiny():
+            continue
+
+        plane = _frame_from(rg.Point3d(pl[i]), rg.Vector3d(vec))
+        profile = _rail_profile_YZ(plane, depth, height)
+
+        srf = rg.Surface.CreateExtrusion(profile, vec)
+        if srf:
+            slots[i] = srf.ToBrep()
+
+    segments = [s for s in slots if s]
+
+    if not segments:
+        return []
+
+    joined = rg.Brep.JoinBreps(segments, 0.01)
+
+    breps: List[rg.Brep] = []
+    for b in joined or segments:
+        breps.append(b.CapPlanarHoles(0.01) or b)
+
+    return breps
 
 
 def _sweep_rail(
@@ -112,11 +238,34 @@ def _sweep_rail(
 ) -> List[rg.Brep]:
     """
     Sweep a rail aligned with posts.
+
+    Polyline guides (the common BIM case) take a per-segment extrusion
+    fast path; true NURBS guides fall back to SweepOneRail.
     """
     rail_crv = crv.Duplicate()
     rail_crv.Transform(rg.Transform.Translation(lateral_offset))
     rail_crv.Transform(rg.Transform.Translation(0, 0, float(z)))
 
+    # A straight guide — regardless of curve type, so this also covers
+    # linear NURBS curves that TryGetPolyline rejects — reduces the
+    # sweep to one linear extrusion of the profile.
+    if rail_crv.IsLinear(1e-6):
+        vec = rail_crv.PointAtEnd - rail_crv.PointAtStart
+
+        plane = _frame_from(rail_crv.PointAtStart, rg.Vector3d(vec))
+        profile = _rail_profile_YZ(plane, depth, height)
+
+        srf = rg.Surface.CreateExtrusion(profile, vec)
+        if not srf:
+            return []
+
+        b = srf.ToBrep()
+        return [b.CapPlanarHoles(0.01) or b]
+
+    ok, pl = rail_crv.TryGetPolyline()
+    if ok and pl.Count >= 2:
+        return _extrude_rail_segments(pl, depth, height)
+
     plane = _frame_at(rail_crv, 0.0)
     profile = _rail_profile_YZ(plane, depth, height)
 
@@ -217,37 +366,105 @@ def fence(
     # --------------------------------------------------
     length = crv.GetLength()
     post_count = max(2, int(round(length / post_spacing_mm)))
-    params = [i / float(post_count - 1) for i in range(post_count)]
+
+    cache_key = (id(crv), post_count, offset_mm)
+    cached = _frame_cache.get(cache_key)
+
+    frames = None
+    if cached is not None and cached[0] is crv:
+        frames = cached[1]
+
+    if frames is None:
+        frames = _frames_along(crv, post_count, lateral_offset)
+
+        if len(_frame_cache) >= _FRAME_CACHE_MAX:
+            _frame_cache.clear()
+        _frame_cache[cache_key] = (crv, frames)
 
     breps: List[rg.Brep] = []
 
-    for t in params:
-        plane = _frame_at(crv, t)
-        plane.Origin += lateral_offset
+    # All posts share the same dimensions; only the frame differs.
+    # Build one prototype at WorldXY and place rigid copies per post:
+    # DuplicateBrep + PlaneToPlane skips re-solving edges/trims that
+    # Extrusion.Create + ToBrep would redo for every post.
+    proto = _post_brep_between_z(
+        rg.Plane.WorldXY,
+        post_depth_mm,
+        post_width_mm,
+        z_bottom,
+        z_top,
+    )
 
-        post = _post_brep_between_z(
-            plane,
-            post_depth_mm,
-            post_width_mm,
-            z_bottom,
-            z_top,
-        )
+    # Posts are independent per frame: each worker writes its own slot,
+    # so no locking is needed.
+    posts: List[rg.Brep] = [None] * len(frames)
+
+    def _build_post(i):
+        post = proto.DuplicateBrep()
+        post.Transform(rg.Transform.PlaneToPlane(rg.Plane.WorldXY, frames[i]))
+        posts[i] = post
+
+    if proto:
+        Parallel.For(0, len(frames), _build_post)
 
-        if post:
-            breps.append(post)
+    breps.extend(p for p in posts if p)
 
     # --------------------------------------------------
     # Rails
     # --------------------------------------------------
-    for z in rail_zs:
-        breps.extend(
-            _sweep_rail(
-                crv,
-                z,
-                rail_depth_mm,
-                rail_height_mm,
-                lateral_offset,
-            )
+    # Sweeps are the heaviest single operation here and have no data
+    # dependency. _sweep_rail duplicates the curve and owns its own
+    # SweepOneRail instance (not documented thread-safe), so each worker
+    # is fully isolated and writes its own slot.
+    rail_results: List[List[rg.Brep]] = [None] * len(rail_zs)
+
+    def _build_rail(i):
+        rail_results[i] = _sweep_rail(
+            crv,
+            rail_zs[i],
+            rail_depth_mm,
+            rail_height_mm,
+            lateral_offset,
         )
 
+    Parallel.For(0, len(rail_zs), _build_rail)
+
+    for rail_breps in rail_results:
+        if rail_breps:
+            breps.extend(rail_breps)
+
+    # One join pass over the output: contiguous pieces merge into fewer
+    # Breps, which cuts downstream per-Brep cost (preview meshing,
+    # bounding boxes). Disjoint pieces pass through unchanged; if the
+    # join fails the loose list is returned as before.
+    joined = rg.Brep.JoinBreps(breps, 0.01)
+    if joined:
+        return list(joined)
+
     return breps
+
+
+# Below this many guides thread startup outweighs the parallel gain.
+_PARALLEL_GUIDE_THRESHOLD = 4
+
+
+def fence_many(guides, **kwargs) -> List[List[rg.Brep]]:
+    """
+    fence() over a list of guide curves, dispatched across cores.
+
+    Returns one result list per guide, in input order. Small batches
+    run serially.
+    """
+    guides = list(guides)
+
+    if len(guides) < _PARALLEL_GUIDE_THRESHOLD:
+        return [fence(g, **kwargs) for g in guides]
+
+    results: List[List[rg.Brep]] = [None] * len(guides)
+
+    def _build(i):
+        results[i] = fence(guides[i], **kwargs)
+
+    Parallel.For(0, len(guides), _build)
+
+    return results
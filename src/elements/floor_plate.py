@@ -1,6 +1,10 @@
 import Rhino.Geometry as rg
 import rhinoscriptsyntax as rs
-from typing import Dict, Iterable, Optional, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from System import Guid
+from System.Threading.Tasks import Parallel
+
+from ._guid_cache import curve_by_guid
 
 
 # ---------------------------------------------------------------------
@@ -9,7 +13,11 @@ from typing import Dict, Iterable, Optional, Union
 
 
 def _coerce_curve(crv) -> rg.Curve:
-    crv = rs.coercecurve(crv)
+    if isinstance(crv, Guid):
+        crv = curve_by_guid(crv)
+    else:
+        crv = rs.coercecurve(crv)
+
     if not crv:
         raise TypeError("boundary must be a Curve")
     return crv
@@ -25,60 +33,130 @@ def _coerce_curves(crvs: Optional[Union[rg.Curve, Iterable]]) -> Iterable[rg.Cur
     return [_coerce_curve(crvs)]
 
 
-def _planar_slab(
-    curve: rg.Curve,
-    z_base: float,
-    thickness: float,
+def _plan_region(
+    boundary: rg.Curve,
     voids: Iterable[rg.Curve],
-) -> Optional[rg.Brep]:
-    """
-    Create a planar slab by extruding a curve downward,
-    with optional void subtraction.
+    tol: float = 0.01,
+) -> Tuple[List[rg.Curve], List[rg.Curve]]:
     """
+    Plan loops of boundary minus voids.
 
-    # Base slab
-    crv = curve.Duplicate()
-    crv.Transform(rg.Transform.Translation(0, 0, float(z_base)))
+    Voids fully inside the boundary — the canonical BIM opening — are
+    returned as extra loops directly: CreatePlanarBreps nests interior
+    loops as holes natively, no boolean needed. Only voids that cross
+    the boundary edge go through the 2D curve boolean.
 
-    slab_ext = rg.Extrusion.Create(
-        crv,
-        -float(thickness),  # extrude DOWN
-        True,
-    )
+    Returns (loops, unresolved): unresolved holds crossing voids the
+    curve boolean failed on, for the caller to subtract as solids.
+    """
 
-    if not slab_ext:
-        return None
+    voids = list(voids)
+    if not voids:
+        return [boundary], []
 
-    slab = slab_ext.ToBrep()
+    ok, plane = boundary.TryGetPlane(tol)
+    if not ok:
+        plane = rg.Plane.WorldXY
 
-    # ---------------------------------------------
-    # Void subtraction
-    # ---------------------------------------------
-    tol = 0.01
+    contained: List[rg.Curve] = []
+    crossing: List[rg.Curve] = []
 
     for void in voids:
-        void_crv = void.Duplicate()
-        void_crv.Transform(rg.Transform.Translation(0, 0, float(z_base)))
+        rel = rg.Curve.PlanarClosedCurveRelationship(boundary, void, plane, tol)
 
-        void_ext = rg.Extrusion.Create(
-            void_crv,
-            -float(thickness),
-            True,
-        )
+        if rel == rg.RegionContainment.BInsideA:
+            contained.append(void)
+        elif rel == rg.RegionContainment.Disjoint:
+            continue  # no effect on the slab
+        else:
+            crossing.append(void)
 
-        if not void_ext:
-            continue
+    loops = [boundary]
+    unresolved: List[rg.Curve] = []
 
-        void_brep = void_ext.ToBrep()
+    if crossing:
+        region = rg.Curve.CreateBooleanDifference(boundary, crossing, tol)
+        if region and len(region) > 0:
+            loops = list(region)
+        else:
+            # Curve boolean failed: keep the boundary and hand these
+            # voids back for solid subtraction, never drop an opening.
+            unresolved = crossing
 
-        result = rg.Brep.CreateBooleanDifference(
-            slab,
-            void_brep,
-            tol,
-        )
+    return loops + contained, unresolved
 
-        if result and len(result) > 0:
-            slab = result[0]
+
+def _planar_slab(
+    loops: List[rg.Curve],
+    unresolved_voids: List[rg.Curve],
+    z_base: float,
+    thickness: float,
+) -> Optional[rg.Brep]:
+    """
+    Create a planar slab by extruding plan loops downward.
+
+    Hole loops are honoured by going through planar Brep faces and
+    offsetting them into solids. Voids the 2D stage could not resolve
+    are subtracted as solids, matching the pre-2D-boolean behaviour.
+    """
+
+    tol = 0.01
+    move = rg.Transform.Translation(0, 0, float(z_base))
+
+    placed: List[rg.Curve] = []
+    for loop in loops:
+        crv = loop.Duplicate()
+        crv.Transform(move)
+        placed.append(crv)
+
+    faces = rg.Brep.CreatePlanarBreps(placed, tol)
+    if not faces or len(faces) == 0:
+        return None
+
+    # Keep every region: a plan split by voids yields several faces.
+    solids: List[rg.Brep] = []
+    for face_brep in faces:
+        for face in face_brep.Faces:
+            solid = rg.Brep.CreateFromOffsetFace(
+                face,
+                -float(thickness),  # extrude DOWN
+                tol,
+                False,
+                True,
+            )
+            if solid:
+                solids.append(solid)
+
+    if not solids:
+        return None
+
+    if len(solids) == 1:
+        slab = solids[0]
+    else:
+        slab = rg.Brep.MergeBreps(solids, tol) or solids[0]
+
+    # ---------------------------------------------
+    # Solid fallback for unresolved voids
+    # ---------------------------------------------
+    if unresolved_voids:
+        tools: List[rg.Brep] = []
+        for void in unresolved_voids:
+            void_crv = void.Duplicate()
+            void_crv.Transform(move)
+
+            void_ext = rg.Extrusion.Create(
+                void_crv,
+                -float(thickness),
+                True,
+            )
+
+            if void_ext:
+                tools.append(void_ext.ToBrep())
+
+        if tools:
+            result = rg.Brep.CreateBooleanDifference([slab], tools, tol)
+            if result and len(result) > 0:
+                slab = result[0]
 
     return slab
 
@@ -116,17 +194,44 @@ def floor_plate(
     voids = _coerce_curves(voids)
 
     z = float(elevation_mm)
-    layers: Dict[str, rg.Brep] = {}
-
-    layers["finish"] = _planar_slab(boundary, z, finish_thickness_mm, voids)
-    z -= finish_thickness_mm
 
-    layers["screed"] = _planar_slab(boundary, z, screed_thickness_mm, voids)
-    z -= screed_thickness_mm
+    # Layer stack, top -> bottom. Void Breps are built once per layer
+    # here rather than inside _planar_slab, so each void curve is
+    # duplicated/translated/extruded exactly once per Z level.
+    stack = [
+        ("finish", float(finish_thickness_mm)),
+        ("screed", float(screed_thickness_mm)),
+        ("insulation", float(insulation_thickness_mm)),
+        ("structural", float(structural_thickness_mm)),
+    ]
+
+    z_levels: List[float] = []
+    for _, thickness in stack:
+        z_levels.append(z)
+        z -= thickness
+
+    # The void classification happens once, in 2D, for all layers:
+    # every layer shares the same plan region and only differs in z
+    # and thickness.
+    loops, unresolved = _plan_region(boundary, voids)
+
+    # The four layers are independent, so their construction runs in
+    # parallel. Workers only read the shared loops (_planar_slab
+    # transforms its own duplicates) and write one result slot each.
+    results: List[Optional[rg.Brep]] = [None] * len(stack)
+
+    def _build_layer(i):
+        results[i] = _planar_slab(
+            loops,
+            unresolved,
+            z_levels[i],
+            stack[i][1],
+        )
 
-    layers["insulation"] = _planar_slab(boundary, z, insulation_thickness_mm, voids)
-    z -= insulation_thickness_mm
+    Parallel.For(0, len(stack), _build_layer)
 
-    layers["structural"] = _planar_slab(boundary, z, structural_thickness_mm, voids)
+    layers: Dict[str, rg.Brep] = {}
+    for i, (name, _) in enumerate(stack):
+        layers[name] = results[i]
 
     return layers
@@ -2,6 +2,13 @@ import Rhino.Geometry as rg
 import rhinoscriptsyntax as rs
 import math
 from typing import Callable, List
+from System.Threading.Tasks import Parallel
+
+try:
+    # Available in Rhino 8's CPython; IronPython hosts fall back to math.
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def louvers(
@@ -81,55 +88,120 @@ def louvers(
     # Number of louvres along the curve
     count = max(1, int(round(curve_length / spacing_mm)))
 
-    # Normalized parameters along curve
+    # Normalized parameters along curve (used for angle / shape
+    # modulation) plus batch-sampled points: one DivideByCount pass
+    # replaces count+1 arc-length solves via PointAtNormalizedLength.
     params = [i / float(count) for i in range(count + 1)]
 
-    breps: List[rg.Brep] = []
+    us = guide.DivideByCount(count, True)
+    points = [guide.PointAt(u) for u in us] if us else []
+
+    # --------------------------------------------------
+    # Per-t behaviour (angles + shape modulation)
+    # --------------------------------------------------
+    # Angle and wave modulation depend only on t, not on the story, so
+    # the user callback and trig run once per parameter instead of once
+    # per (story, t) pair.
+    if np is not None:
+        # One vectorized sin over all parameters (SIMD-backed) instead
+        # of a scalar math.sin per louver. angle_fn stays a Python
+        # callback, so only the twist term is folded in per element.
+        waves = np.sin(np.asarray(params) * (math.pi * 2 * wave_frequency))
+
+        depths = (depth_mm + waves * wave_amplitude_mm).tolist()
+        thicknesses = (thickness_mm + waves * (wave_amplitude_mm * 0.4)).tolist()
+        angles = [
+            angle_fn(t) + w * twist_amplitude_rad
+            for t, w in zip(params, waves.tolist())
+        ]
+    else:
+        n = len(params)
+        angles = [0.0] * n
+        depths = [0.0] * n
+        thicknesses = [0.0] * n
+
+        for i, t in enumerate(params):
+            wave = math.sin(t * math.pi * 2 * wave_frequency)
+
+            angles[i] = angle_fn(t) + wave * twist_amplitude_rad
+            depths[i] = depth_mm + wave * wave_amplitude_mm
+            thicknesses[i] = thickness_mm + wave * (wave_amplitude_mm * 0.4)
 
     # --------------------------------------------------
     # Build geometry
     # --------------------------------------------------
-    for story in range(stories):
+    # The (story, t) product is flattened to one index range so the
+    # whole job can be dispatched across cores in a single Parallel.For.
+    # Each worker only reads the guide and writes its own slot.
+    per_story = len(points)
+    results: List[rg.Brep] = [None] * (stories * per_story)
+
+    def _build_louver(k):
+        story, idx = divmod(k, per_story)
         z_offset = story * story_height_mm
 
-        for t in params:
-            # ------------------------------------------
-            # Position
-            # ------------------------------------------
-            pt = guide.PointAtNormalizedLength(t)
-            pt.Z += z_offset
+        # ------------------------------------------
+        # Position
+        # ------------------------------------------
+        base = points[idx]
+        pt = rg.Point3d(base.X, base.Y, base.Z + z_offset)
 
-            # ------------------------------------------
-            # Behaviour (angles)
-            # ------------------------------------------
-            base_angle = angle_fn(t)
+        # ------------------------------------------
+        # Geometry
+        # ------------------------------------------
+        plane = rg.Plane(pt, rg.Vector3d.ZAxis)
+        plane.Rotate(angles[idx], plane.ZAxis)
 
-            local_twist = (
-                math.sin(t * math.pi * 2 * wave_frequency) * twist_amplitude_rad
-            )
+        # PolylineCurve instead of Rectangle3d -> NURBS: extrudes on
+        # the lightweight polyline path and stores no spline data.
+        d = float(depths[idx])
+        th = float(thicknesses[idx])
+        profile = rg.PolylineCurve(
+            [
+                plane.PointAt(0.0, 0.0),
+                plane.PointAt(d, 0.0),
+                plane.PointAt(d, th),
+                plane.PointAt(0.0, th),
+                plane.PointAt(0.0, 0.0),
+            ]
+        )
 
-            angle = base_angle + local_twist
+        ext = rg.Extrusion.Create(profile, float(height_mm), True)
+        if ext:
+            results[k] = ext.ToBrep()
+
+    Parallel.For(0, stories * per_story, _build_louver)
+
+    return [b for b in results if b]
 
-            # ------------------------------------------
-            # Shape modulation
-            # ------------------------------------------
-            wave = math.sin(t * math.pi * 2 * wave_frequency)
 
-            depth = depth_mm + wave * wave_amplitude_mm
-            thickness = thickness_mm + wave * (wave_amplitude_mm * 0.4)
+# Below this many guides thread startup outweighs the parallel gain.
+_PARALLEL_GUIDE_THRESHOLD = 4
+
+
+def louvers_many(
+    guides,
+    spacing_mm: float,
+    angle_fn: Callable[[float], float],
+    depth_mm: float,
+    **kwargs
+) -> List[List[rg.Brep]]:
+    """
+    louvers() over a list of guide curves, dispatched across cores.
+
+    Returns one result list per guide, in input order. Small batches
+    run serially.
+    """
+    guides = list(guides)
 
-            # ------------------------------------------
-            # Geometry
-            # ------------------------------------------
-            plane = rg.Plane(pt, rg.Vector3d.ZAxis)
-            plane.Rotate(angle, plane.ZAxis)
+    if len(guides) < _PARALLEL_GUIDE_THRESHOLD:
+        return [louvers(g, spacing_mm, angle_fn, depth_mm, **kwargs) for g in guides]
 
-            rect = rg.Rectangle3d(plane, float(depth), float(thickness))
+    results: List[List[rg.Brep]] = [None] * len(guides)
 
-            profile = rect.ToNurbsCurve()
+    def _build(i):
+        results[i] = louvers(guides[i], spacing_mm, angle_fn, depth_mm, **kwargs)
 
-            ext = rg.Extrusion.Create(profile, float(height_mm), True)
-            if ext:
-                breps.append(ext.ToBrep())
+    Parallel.For(0, len(guides), _build)
 
-    return breps
+    return results
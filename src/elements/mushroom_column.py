@@ -1,8 +1,11 @@
 import Rhino.Geometry as rg
 import rhinoscriptsyntax as rs
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 from System import Guid
 
+from ._guid_cache import point3d_by_guid
+
 
 def _coerce_point3d(p) -> rg.Point3d:
     """
@@ -16,40 +19,33 @@ def _coerce_point3d(p) -> rg.Point3d:
     if isinstance(p, rg.Point3d):
         return p
 
-    # Case 2: Guid -> Rhino geometry
+    # Case 2: Guid -> Rhino geometry (cached document lookup)
     if isinstance(p, Guid):
-        geom = rs.coercegeometry(p)
-        if isinstance(geom, rg.Point):
-            return geom.Location
-        if isinstance(geom, rg.Point3d):
-            return geom
+        pt = point3d_by_guid(p)
+        if pt is not None:
+            return pt
 
     raise TypeError("base_point must be a Grasshopper Point or Point3d")
 
 
-def mushroom_column(
-    base_point,
-    height_mm: float = 3200,
-    shaft_radius_mm: float = 250,
-    capital_radius_mm: float = 600,
-    capital_height_mm: float = 450,
-    slab_thickness_mm: float = 300,
-    slab_radius_mm: float = 1200,
-    fillet_radius_mm: float = 0,
-) -> List[rg.Brep]:
+@lru_cache(maxsize=32)
+def _column_template(
+    height_mm: float,
+    shaft_radius_mm: float,
+    capital_radius_mm: float,
+    capital_height_mm: float,
+    slab_thickness_mm: float,
+    slab_radius_mm: float,
+) -> Tuple[rg.Brep, ...]:
+    """
+    Shaft / capital / slab Breps built once at the world origin.
 
-    # --------------------------------------------------
-    # Coerce inputs
-    # --------------------------------------------------
-    pt = _coerce_point3d(base_point)
+    Grid callers placing many identical columns hit the cache and only
+    pay for a duplicate + translation per column instead of
+    re-extruding and re-lofting every time.
+    """
 
-    height_mm = float(height_mm)
-    shaft_radius_mm = float(shaft_radius_mm)
-    capital_radius_mm = float(capital_radius_mm)
-    capital_height_mm = float(capital_height_mm)
-    slab_thickness_mm = float(slab_thickness_mm)
-    slab_radius_mm = float(slab_radius_mm)
-    fillet_radius_mm = float(fillet_radius_mm)
+    pt = rg.Point3d.Origin
 
     z_axis = rg.Vector3d.ZAxis
     breps: List[rg.Brep] = []
@@ -100,6 +96,53 @@ def mushroom_column(
     if slab:
         breps.append(slab.ToBrep())
 
+    return tuple(breps)
+
+
+def mushroom_column(
+    base_point,
+    height_mm: float = 3200,
+    shaft_radius_mm: float = 250,
+    capital_radius_mm: float = 600,
+    capital_height_mm: float = 450,
+    slab_thickness_mm: float = 300,
+    slab_radius_mm: float = 1200,
+    fillet_radius_mm: float = 0,
+) -> List[rg.Brep]:
+
+    # --------------------------------------------------
+    # Coerce inputs
+    # --------------------------------------------------
+    pt = _coerce_point3d(base_point)
+
+    height_mm = float(height_mm)
+    shaft_radius_mm = float(shaft_radius_mm)
+    capital_radius_mm = float(capital_radius_mm)
+    capital_height_mm = float(capital_height_mm)
+    slab_thickness_mm = float(slab_thickness_mm)
+    slab_radius_mm = float(slab_radius_mm)
+    fillet_radius_mm = float(fillet_radius_mm)
+
+    # --------------------------------------------------
+    # Place template copies at the base point
+    # --------------------------------------------------
+    template = _column_template(
+        height_mm,
+        shaft_radius_mm,
+        capital_radius_mm,
+        capital_height_mm,
+        slab_thickness_mm,
+        slab_radius_mm,
+    )
+
+    move = rg.Transform.Translation(pt.X, pt.Y, pt.Z)
+
+    breps: List[rg.Brep] = []
+    for b in template:
+        dup = b.DuplicateBrep()
+        dup.Transform(move)
+        breps.append(dup)
+
     # --------------------------------------------------
     # Optional fillet
     # --------------------------------------------------
@@ -107,16 +150,38 @@ def mushroom_column(
         try:
             joined = rg.Brep.JoinBreps(breps, 0.01)
             if joined:
-                filleted = rg.Brep.CreateFilletEdges(
-                    joined[0],
-                    joined[0].Edges,
-                    [fillet_radius_mm] * joined[0].Edges.Count,
-                    [fillet_radius_mm] * joined[0].Edges.Count,
-                    rg.BlendType.Fillet,
-                    0.01,
+                # Only the two junction rings matter visually:
+                # shaft -> capital and capital -> slab. Filleting every
+                # edge of the joined solid (seams, caps, outer rims)
+                # feeds dozens of edges into a super-linear solve.
+                junction_zs = (
+                    pt.Z + height_mm - capital_height_mm,
+                    pt.Z + height_mm,
                 )
-                if filleted:
-                    breps = filleted
+                z_tol = 0.5
+
+                edge_indices = [
+                    edge.EdgeIndex
+                    for edge in joined[0].Edges
+                    if any(
+                        abs(edge.PointAtStart.Z - zj) < z_tol
+                        and abs(edge.PointAtEnd.Z - zj) < z_tol
+                        for zj in junction_zs
+                    )
+                ]
+
+                if edge_indices:
+                    radii = [fillet_radius_mm] * len(edge_indices)
+                    filleted = rg.Brep.CreateFilletEdges(
+                        joined[0],
+                        edge_indices,
+                        radii,
+                        radii,
+                        rg.BlendType.Fillet,
+                        0.01,
+                    )
+                    if filleted:
+                        breps = filleted
         except:
             pass
 
@@ -1,7 +1,14 @@
 import Rhino.Geometry as rg
 import rhinoscriptsyntax as rs
-from typing import List, Literal
+from typing import List, Literal, Tuple
 import math
+from System.Threading.Tasks import Parallel
+
+try:
+    # Available in Rhino 8's CPython; IronPython hosts fall back to math.
+    import numpy as np
+except ImportError:
+    np = None
 
 StairSide = Literal["left", "right", "center"]
 
@@ -35,6 +42,70 @@ def _left_vector(dir: rg.Vector3d) -> rg.Vector3d:
     return left
 
 
+def _tread_origins(
+    base: rg.Point3d,
+    dir: rg.Vector3d,
+    tread_depth: float,
+    riser_height: float,
+    z0: float,
+    n: int,
+) -> List[Tuple[float, float, float]]:
+    """
+    Origins for n consecutive treads along a flight, as raw xyz tuples.
+
+    Runs the placement arithmetic on plain floats (vectorized when
+    NumPy is available) instead of per-step Vector3d operations that
+    dispatch through .NET interop component by component.
+    """
+    bx, by, bz = base.X, base.Y, base.Z
+    dx, dy, dz = dir.X, dir.Y, dir.Z
+
+    if np is not None:
+        run = np.arange(n) * tread_depth
+        rise = z0 + np.arange(n) * riser_height
+        return list(
+            zip(
+                (bx + dx * run).tolist(),
+                (by + dy * run).tolist(),
+                (bz + dz * run + rise).tolist(),
+            )
+        )
+
+    origins = []
+    for s in range(n):
+        run = s * tread_depth
+        origins.append(
+            (
+                bx + dx * run,
+                by + dy * run,
+                bz + dz * run + z0 + s * riser_height,
+            )
+        )
+    return origins
+
+
+def _slab_proto(depth: float, width: float, thickness: float) -> rg.Brep:
+    """
+    Prototype tread / landing slab at WorldXY, to be instanced per step
+    via DuplicateBrep + PlaneToPlane instead of re-extruding.
+    """
+    # PolylineCurve instead of Rectangle3d -> NURBS: extrudes on the
+    # lightweight polyline path and stores no spline data.
+    plane = rg.Plane.WorldXY
+    rect = rg.PolylineCurve(
+        [
+            plane.PointAt(0.0, 0.0),
+            plane.PointAt(depth, 0.0),
+            plane.PointAt(depth, width),
+            plane.PointAt(0.0, width),
+            plane.PointAt(0.0, 0.0),
+        ]
+    )
+
+    ext = rg.Extrusion.Create(rect, thickness, True)
+    return ext.ToBrep() if ext else None
+
+
 def _alignment_offset(width: float, side: StairSide) -> float:
     if side == "center":
         return -width * 0.5
@@ -80,7 +151,21 @@ def stair_from_polyline(
     current_step = 0
     current_z = 0.0
 
-    breps: List[rg.Brep] = []
+    # Exact upper bound on output size: every tread plus one landing
+    # per interior kink. Slots are assigned by index instead of growing
+    # the list with append in the hot loop.
+    breps: List[rg.Brep] = [None] * (tread_count + max(0, pl.Count - 2))
+    brep_idx = 0
+
+    # All treads share one geometry and all landings another; build each
+    # prototype once and place rigid copies, instead of running
+    # Extrusion.Create + ToBrep per step.
+    tread_proto = _slab_proto(tread_depth_mm, width_mm, tread_thickness_mm)
+    landing_proto = (
+        _slab_proto(landing_depth_mm, width_mm, tread_thickness_mm)
+        if pl.Count > 2
+        else None
+    )
 
     # --------------------------------------------------
     # Walk the polyline
@@ -101,33 +186,33 @@ def stair_from_polyline(
         # ----------------------------------------------
         # Treads in this flight
         # ----------------------------------------------
-        for s in range(steps_here):
-            if current_step >= tread_count:
-                break
-
-            origin = (
-                base_origin + dir * (s * tread_depth_mm) + rg.Vector3d.ZAxis * current_z
-            )
+        flight_steps = min(steps_here, tread_count - current_step)
 
-            plane = rg.Plane(origin, dir, left)
+        origins = _tread_origins(
+            base_origin,
+            dir,
+            tread_depth_mm,
+            riser_height,
+            current_z,
+            flight_steps,
+        )
 
-            rect = rg.Rectangle3d(
-                plane,
-                rg.Interval(0, tread_depth_mm),
-                rg.Interval(0, width_mm),
-            ).ToNurbsCurve()
+        if tread_proto:
+            for x, y, z in origins:
+                plane = rg.Plane(rg.Point3d(x, y, z), dir, left)
 
-            ext = rg.Extrusion.Create(rect, tread_thickness_mm, True)
-            if ext:
-                breps.append(ext.ToBrep())
+                tread = tread_proto.DuplicateBrep()
+                tread.Transform(rg.Transform.PlaneToPlane(rg.Plane.WorldXY, plane))
+                breps[brep_idx] = tread
+                brep_idx += 1
 
-            current_step += 1
-            current_z += riser_height
+        current_step += flight_steps
+        current_z += flight_steps * riser_height
 
         # ----------------------------------------------
         # Landing at kink
         # ----------------------------------------------
-        if i < pl.Count - 2 and current_step < tread_count:
+        if i < pl.Count - 2 and current_step < tread_count and landing_proto:
             landing_origin = (
                 base_origin
                 + dir * (steps_here * tread_depth_mm)
@@ -136,14 +221,49 @@ def stair_from_polyline(
 
             plane = rg.Plane(landing_origin, dir, left)
 
-            rect = rg.Rectangle3d(
-                plane,
-                rg.Interval(0, landing_depth_mm),
-                rg.Interval(0, width_mm),
-            ).ToNurbsCurve()
+            landing = landing_proto.DuplicateBrep()
+            landing.Transform(rg.Transform.PlaneToPlane(rg.Plane.WorldXY, plane))
+            breps[brep_idx] = landing
+            brep_idx += 1
+
+    result = breps[:brep_idx]
+
+    # One join pass over the stair: contiguous treads/landings merge so
+    # downstream components handle fewer Breps. A failed join falls
+    # back to the loose list.
+    joined = rg.Brep.JoinBreps(result, 0.01)
+    if joined:
+        return list(joined)
+
+    return result
+
+
+# Below this many guides thread startup outweighs the parallel gain.
+_PARALLEL_GUIDE_THRESHOLD = 4
+
+
+def stair_many(
+    guides,
+    total_height_mm: float,
+    **kwargs
+) -> List[List[rg.Brep]]:
+    """
+    stair_from_polyline() over a list of guides, dispatched across
+    cores.
+
+    Returns one result list per guide, in input order. Small batches
+    run serially.
+    """
+    guides = list(guides)
+
+    if len(guides) < _PARALLEL_GUIDE_THRESHOLD:
+        return [stair_from_polyline(g, total_height_mm, **kwargs) for g in guides]
+
+    results: List[List[rg.Brep]] = [None] * len(guides)
+
+    def _build(i):
+        results[i] = stair_from_polyline(guides[i], total_height_mm, **kwargs)
 
-            ext = rg.Extrusion.Create(rect, tread_thickness_mm, True)
-            if ext:
-                breps.append(ext.ToBrep())
+    Parallel.For(0, len(guides), _build)
 
-    return breps
+    return results